@@ -7,7 +7,6 @@ import sys
 import time
 import signal
 import os
-sys.path.insert(0, '/app')
 
 from securnote.metrics import metrics_collector
 from securnote.logging_config import setup_logging
@@ -20,6 +20,7 @@ from .repository import (
     UserRepository,
 )
 from .services import AuthService, CertificateService, NoteService, ZKProofService
+from .storage import NoteStorage
 
 
 class SecurNoteApplication:
@@ -28,8 +29,12 @@ class SecurNoteApplication:
     Clean architecture implementation with proper separation of concerns.
     """
 
-    def __init__(self, data_dir: str = "data"):
-        """Initialize application with all dependencies."""
+    def __init__(self, data_dir: str = "data", ca_private_key=None):
+        """Initialize application with all dependencies.
+
+        ca_private_key optionally reuses an existing CA key instead of
+        generating a fresh one per instance.
+        """
         # Logger
         self.logger = get_logger(__name__)
 
@@ -48,7 +53,7 @@ class SecurNoteApplication:
             self.user_repo, self.challenge_repo, self.config
         )
         self.cert_service = CertificateService(
-            self.user_repo, self.revocation_repo, self.config
+            self.user_repo, self.revocation_repo, self.config, ca_private_key
         )
         self.note_service = NoteService(
             self.note_repo, self.auth_service, self.cert_service
@@ -222,6 +227,9 @@ class SecurNoteApplication:
 # Global application instance for backward compatibility
 _app_instance = None
 
+# Global storage instance shared by CLI and web entry points
+_storage_instance = None
+
 
 def get_application(data_dir: str = "data") -> SecurNoteApplication:
     """Get singleton application instance."""
@@ -231,6 +239,19 @@ def get_application(data_dir: str = "data") -> SecurNoteApplication:
     return _app_instance
 
 
+def get_storage(data_dir: str = "data") -> NoteStorage:
+    """Get singleton note storage instance.
+
+    Every entry point used to construct its own NoteStorage pointing at
+    the same files; sharing one instance avoids duplicated filesystem
+    state and gives future caching a single place to live.
+    """
+    global _storage_instance
+    if _storage_instance is None:
+        _storage_instance = NoteStorage(data_dir)
+    return _storage_instance
+
+
 # Backward compatible UserAuth class
 class UserAuth:
     """
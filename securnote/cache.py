@@ -0,0 +1,72 @@
+"""
+Bounded in-memory TTL cache for short-lived state.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class BoundedTTLCache:
+    """Thread-safe dict-like cache with a size bound and per-entry expiry.
+
+    Entries expire ttl_seconds after insertion; when the cache is full the
+    oldest entry is evicted. Memory use is therefore bounded by maxsize,
+    unlike a bare module-level dict that grows forever.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 3600.0) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Any, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Return cached value, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if time.monotonic() > expires_at:
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store value, evicting expired then oldest entries if full."""
+        now = time.monotonic()
+        with self._lock:
+            if len(self._entries) >= self.maxsize and key not in self._entries:
+                self._sweep(now)
+                if len(self._entries) >= self.maxsize:
+                    # Still full: drop the entry closest to expiry
+                    oldest = min(self._entries, key=lambda k: self._entries[k][1])
+                    del self._entries[oldest]
+            self._entries[key] = (value, now + self.ttl_seconds)
+
+    def pop(self, key: Any) -> Optional[Any]:
+        """Remove and return value if present and unexpired, else None."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if time.monotonic() > expires_at:
+                return None
+            return value
+
+    def discard(self, key: Any) -> None:
+        """Remove key if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def _sweep(self, now: float) -> None:
+        """Drop expired entries. Caller must hold the lock."""
+        expired = [k for k, (_, exp) in self._entries.items() if now > exp]
+        for key in expired:
+            del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -4,15 +4,17 @@ Simple CLI interface for SecurNote.
 
 import getpass
 
+from cryptography.exceptions import InvalidTag
+
+from .application import get_storage
 from .auth import UserAuth
 from .crypto import NoteCrypto
-from .storage import NoteStorage
 
 
 class SecurNoteCLI:
     def __init__(self):
         self.auth = UserAuth()
-        self.storage = NoteStorage()
+        self.storage = get_storage()
         self.current_user = None
         self.note_key = None
         self.crypto = None
@@ -245,21 +247,17 @@ class SecurNoteCLI:
             return
 
         print("=== Your Notes ===")
+        decrypt = self.crypto.decrypt  # hoist bound method out of the loop
         for i, note in enumerate(notes, 1):
             # Decrypt title for display
             try:
-                title = self.crypto.decrypt(
-                    note["title_encrypted"], note["title_nonce"]
-                )
-                print(f"{i}. {title}")
-                print(f"   ID: {note['id']}")
-                print(f"   Created: {note['timestamp'][:19]}")
-                print()
-            except:
-                print(f"{i}. [Encrypted Title]")
-                print(f"   ID: {note['id']}")
-                print(f"   Created: {note['timestamp'][:19]}")
-                print()
+                title = decrypt(note["title_encrypted"], note["title_nonce"])
+            except InvalidTag:
+                title = "[Encrypted Title]"
+            print(f"{i}. {title}")
+            print(f"   ID: {note['id']}")
+            print(f"   Created: {note['timestamp'][:19]}")
+            print()
 
     def view_note(self):
         """View specific note."""
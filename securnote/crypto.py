@@ -7,7 +7,7 @@ import json
 import os
 import secrets
 from datetime import datetime
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives import hashes, serialization
@@ -16,7 +16,12 @@ from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 
 class NoteCrypto:
-    """Handles note encryption and decryption using AES-GCM."""
+    """Handles note encryption and decryption using AES-GCM.
+
+    All cipher work goes through cryptography's AESGCM, i.e. OpenSSL's
+    EVP layer, which picks up AES-NI/CLMUL where the CPU has them; no
+    pure-Python crypto runs on the note path.
+    """
 
     def __init__(self, key: bytes) -> None:
         """Initialize with user's note key.
@@ -45,6 +50,52 @@ class NoteCrypto:
 
         return encrypted_b64, nonce_b64
 
+    def encrypt_many(self, texts: List[str]) -> List[Tuple[str, str]]:
+        """Encrypt several texts with one randomness draw and cipher.
+
+        All nonces come from a single token_bytes call and the hot names
+        are bound to locals, so per-field overhead is one AEAD call
+        instead of a full encrypt() setup.
+
+        Args:
+            texts: Plain texts to encrypt
+
+        Returns:
+            List of (encrypted_data, nonce) base64 string tuples, in the
+            same order as the inputs
+        """
+        nonces = secrets.token_bytes(12 * len(texts))
+        encrypt = self.aes.encrypt
+        b64encode = base64.b64encode
+
+        results = []
+        for i, text in enumerate(texts):
+            nonce = nonces[i * 12 : (i + 1) * 12]
+            encrypted = encrypt(nonce, text.encode(), None)
+            results.append(
+                (b64encode(encrypted).decode(), b64encode(nonce).decode())
+            )
+        return results
+
+    def encrypt_pair(self, first: str, second: str) -> Tuple[str, str, str, str]:
+        """Encrypt two texts with one cipher instance and one randomness draw.
+
+        Used for title+content pairs on the note write path; see
+        encrypt_many for the batching details.
+
+        Args:
+            first: First plain text to encrypt
+            second: Second plain text to encrypt
+
+        Returns:
+            Tuple of (first_encrypted, first_nonce, second_encrypted,
+            second_nonce) as base64 strings
+        """
+        (first_encrypted, first_nonce), (second_encrypted, second_nonce) = (
+            self.encrypt_many([first, second])
+        )
+        return first_encrypted, first_nonce, second_encrypted, second_nonce
+
     def decrypt(self, encrypted_b64: str, nonce_b64: str) -> str:
         """Decrypt base64 encoded data.
 
@@ -63,12 +114,16 @@ class NoteCrypto:
 
 
 class CertificateAuthority:
-    def __init__(self, ca_private_key=None, data_dir="data"):
-        """Initialize CA with private key. Generate new one if not provided."""
+    def __init__(self, ca_private_key=None, data_dir="data", key_size=2048):
+        """Initialize CA with private key. Generate new one if not provided.
+
+        key_size only applies when generating; tests lower it since
+        keygen cost grows roughly cubically with modulus size.
+        """
         if ca_private_key is None:
             self.ca_private_key = rsa.generate_private_key(
                 public_exponent=65537,
-                key_size=2048,
+                key_size=key_size,
             )
         else:
             self.ca_private_key = ca_private_key
@@ -225,13 +280,13 @@ class CertificateAuthority:
 
 
 class SecureUser:
-    def __init__(self, username, private_key=None):
+    def __init__(self, username, private_key=None, key_size=2048):
         """Initialize user with username and optional private key."""
         self.username = username
         if private_key is None:
             self.private_key = rsa.generate_private_key(
                 public_exponent=65537,
-                key_size=2048,
+                key_size=key_size,
             )
         else:
             self.private_key = private_key
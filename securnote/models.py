@@ -2,11 +2,30 @@
 Data models and domain entities for SecurNote.
 """
 
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 
+def _pbkdf2_iterations_default() -> int:
+    """PBKDF2 cost, overridable via SECURNOTE_KDF_ITERATIONS.
+
+    Lets deployments tune KDF latency (and tests lower it) without
+    touching code.
+    """
+    return int(os.getenv("SECURNOTE_KDF_ITERATIONS", "100000"))
+
+
+def _rsa_key_size_default() -> int:
+    """RSA modulus size, overridable via SECURNOTE_RSA_KEY_SIZE.
+
+    Same escape hatch as the KDF cost: tests shrink keys for speed
+    without production code changes.
+    """
+    return int(os.getenv("SECURNOTE_RSA_KEY_SIZE", "2048"))
+
+
 @dataclass
 class AuthData:
     """Traditional authentication data."""
@@ -87,8 +106,8 @@ class Note:
 class SecurityConfig:
     """Security configuration."""
 
-    pbkdf2_iterations: int = 100000
-    rsa_key_size: int = 2048
+    pbkdf2_iterations: int = field(default_factory=_pbkdf2_iterations_default)
+    rsa_key_size: int = field(default_factory=_rsa_key_size_default)
     challenge_expiry_seconds: int = 300
     auth_salt_size: int = 32
     note_salt_size: int = 32
@@ -7,10 +7,12 @@ import argparse
 import sys
 from typing import Optional
 
+from cryptography.exceptions import InvalidTag
+
 from .cli import SecurNoteCLI
+from .application import get_storage
 from .auth import UserAuth
 from .crypto import NoteCrypto
-from .storage import NoteStorage
 from .activity_logger import activity_logger
 from .metrics import metrics_collector
 
@@ -20,7 +22,7 @@ class RemoteCLI:
 
     def __init__(self):
         self.auth = UserAuth()
-        self.storage = NoteStorage()
+        self.storage = get_storage()
 
     def register_user(self, username: str, password: str) -> bool:
         """Register a new user."""
@@ -65,15 +67,16 @@ class RemoteCLI:
 
         print("Your Notes:")
         print("-" * 50)
+        decrypt = crypto.decrypt  # hoist bound method out of the loop
         for i, note in enumerate(notes, 1):
             try:
-                title = crypto.decrypt(note["title_encrypted"], note["title_nonce"])
+                title = decrypt(note["title_encrypted"], note["title_nonce"])
                 created = note['timestamp'][:19]
                 print(f"{i}. {title}")
                 print(f"   ID: {note['id']}")
                 print(f"   Created: {created}")
                 print()
-            except Exception:
+            except InvalidTag:
                 print(f"{i}. [Decryption Failed]")
                 print(f"   ID: {note['id']}")
                 print()
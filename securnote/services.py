@@ -3,6 +3,7 @@ Service layer for business logic.
 """
 
 import hashlib
+import hmac
 import secrets
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple
@@ -10,6 +11,7 @@ from typing import List, Optional, Tuple
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+from .cache import BoundedTTLCache
 from .crypto import CertificateAuthority, NoteCrypto, SecureUser
 from .exceptions import (
     CertificateRevokedError,
@@ -44,6 +46,9 @@ class AuthService:
     def __init__(self, user_repo: UserRepository, config: SecurityConfig):
         self.user_repo = user_repo
         self.config = config
+        # Derived note keys are deterministic per (user, password); cache
+        # them so repeat logins in one process skip the PBKDF2 run.
+        self._note_key_cache = BoundedTTLCache(maxsize=256, ttl_seconds=3600)
 
     def create_user(self, username: str, password: str) -> User:
         """Create new user with all authentication data."""
@@ -97,14 +102,20 @@ class AuthService:
         if password_hash != user.auth_data.password_hash:
             raise InvalidCredentialsError("Invalid password")
 
-        # Generate note key
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=user.auth_data.note_salt,
-            iterations=self.config.pbkdf2_iterations,
-        )
-        note_key = kdf.derive(password.encode())
+        # Generate note key (cached after the first derivation; the cache
+        # key includes the verified password hash so a password change
+        # invalidates it naturally)
+        cache_key = (username, password_hash)
+        note_key = self._note_key_cache.get(cache_key)
+        if note_key is None:
+            kdf = PBKDF2HMAC(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=user.auth_data.note_salt,
+                iterations=self.config.pbkdf2_iterations,
+            )
+            note_key = kdf.derive(password.encode())
+            self._note_key_cache.set(cache_key, note_key)
         return note_key
 
     def get_user(self, username: str) -> User:
@@ -201,7 +212,7 @@ class ZKProofService:
                         (user.zk_data.password_hash + challenge_data).encode()
                     ).hexdigest()
 
-                    if proof == expected_proof:
+                    if hmac.compare_digest(proof, expected_proof):
                         # Mark challenge as used
                         self.challenge_repo.mark_challenge_used(challenge_id)
                         return True
@@ -223,16 +234,23 @@ class CertificateService:
         user_repo: UserRepository,
         revocation_repo: RevocationRepository,
         config: SecurityConfig,
+        ca_private_key=None,
     ):
         self.user_repo = user_repo
         self.revocation_repo = revocation_repo
         self.config = config
-        self.ca = CertificateAuthority(data_dir=user_repo.data_dir)
+        # An injected CA key skips RSA keygen and keeps certificates
+        # verifiable across application instances sharing that key
+        self.ca = CertificateAuthority(
+            ca_private_key=ca_private_key,
+            data_dir=user_repo.data_dir,
+            key_size=config.rsa_key_size,
+        )
 
     def issue_certificate_for_user(self, user: User) -> User:
         """Issue PKI certificate for user and update user entity."""
         # Create SecureUser instance
-        secure_user = SecureUser(user.username)
+        secure_user = SecureUser(user.username, key_size=self.config.rsa_key_size)
 
         # Request certificate from CA
         cert_data = secure_user.request_certificate(self.ca)
@@ -314,10 +332,11 @@ class NoteService:
                 f"Certificate for {username} is revoked or invalid"
             )
 
-        # Encrypt note
+        # Encrypt note (single cipher setup for both fields)
         crypto = NoteCrypto(note_key)
-        title_encrypted, title_nonce = crypto.encrypt(title)
-        content_encrypted, content_nonce = crypto.encrypt(content)
+        title_encrypted, title_nonce, content_encrypted, content_nonce = (
+            crypto.encrypt_pair(title, content)
+        )
 
         # Create note entity
         note = Note(
@@ -1,5 +1,5 @@
 """
-Simple JSON file storage for notes.
+Simple MessagePack file storage for notes.
 """
 
 import json
@@ -7,34 +7,72 @@ import os
 import uuid
 from datetime import datetime
 
+import msgpack
+
 
 class NoteStorage:
-    def __init__(self, data_dir="data"):
+    def __init__(self, data_dir="data", backend="file"):
+        """Create storage over the given directory.
+
+        backend="memory" keeps notes in a process-local dict instead of
+        touching the filesystem; tests use it to skip disk I/O.
+        """
+        if backend not in ("file", "memory"):
+            raise ValueError(f"Unknown storage backend: {backend}")
         self.data_dir = data_dir
-        self.notes_dir = os.path.join(data_dir, "notes")
-        os.makedirs(self.notes_dir, exist_ok=True)
+        self.backend = backend
+        if backend == "memory":
+            self._memory_notes = {}
+        else:
+            self.notes_dir = os.path.join(data_dir, "notes")
+            os.makedirs(self.notes_dir, exist_ok=True)
 
     def _get_user_file(self, username):
         """Get user's notes file path."""
+        return os.path.join(self.notes_dir, f"{username}.msgpack")
+
+    def _get_legacy_file(self, username):
+        """Get the pre-MessagePack JSON file path."""
         return os.path.join(self.notes_dir, f"{username}.json")
 
     def _load_notes(self, username):
-        """Load user's notes from file."""
-        user_file = self._get_user_file(username)
-        if not os.path.exists(user_file):
-            return []
+        """Load user's notes from the backend."""
+        if self.backend == "memory":
+            return self._memory_notes.get(username, [])
 
-        with open(user_file, "r") as f:
-            data = json.load(f)
-            return data.get("notes", [])
+        try:
+            with open(self._get_user_file(username), "rb") as f:
+                data = msgpack.unpackb(f.read(), raw=False)
+                return data.get("notes", [])
+        except FileNotFoundError:
+            pass
+
+        # Fall back to a legacy JSON file; it is rewritten as
+        # MessagePack on the next save
+        try:
+            with open(self._get_legacy_file(username), "r") as f:
+                data = json.load(f)
+                return data.get("notes", [])
+        except FileNotFoundError:
+            return []
 
     def _save_notes(self, username, notes):
-        """Save user's notes to file."""
+        """Save user's notes to the backend."""
+        if self.backend == "memory":
+            self._memory_notes[username] = notes
+            return
+
         user_file = self._get_user_file(username)
         data = {"notes": notes}
 
-        with open(user_file, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(user_file, "wb") as f:
+            f.write(msgpack.packb(data, use_bin_type=True))
+
+        # Drop the legacy JSON copy once the msgpack file exists
+        try:
+            os.remove(self._get_legacy_file(username))
+        except FileNotFoundError:
+            pass
 
     def add_note(
         self, username, title_encrypted, content_encrypted, title_nonce, content_nonce
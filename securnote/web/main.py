@@ -2,13 +2,19 @@
 SecurNote Info API - Minimal informational interface
 """
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from pydantic import BaseModel
 from typing import List, Optional
+import asyncio
+import hashlib
 import os
 import secrets
 
+import orjson
+
+from ..application import get_application
 from ..logging_config import get_logger
 from ..activity_logger import activity_logger
 
@@ -18,18 +24,29 @@ app = FastAPI(
     title="SecurNote Admin Panel",
     description="Admin monitoring interface for SecurNote. Shows user activity logs.",
     version="2.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 security = HTTPBasic()
 
-# Admin credentials from environment
+# Admin credentials from environment, hashed once at import. Each
+# request hashes what the client sent and compares fixed-length
+# digests, so the comparison cost never depends on credential length
 ADMIN_USERNAME = os.getenv("ADMIN_USERNAME", "admin")
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "securnote123")
+_ADMIN_USERNAME_HASH = hashlib.blake2b(ADMIN_USERNAME.encode(), digest_size=32).digest()
+_ADMIN_PASSWORD_HASH = hashlib.blake2b(ADMIN_PASSWORD.encode(), digest_size=32).digest()
 
 def verify_admin(credentials: HTTPBasicCredentials = Depends(security)):
     """Verify admin credentials."""
-    is_correct_username = secrets.compare_digest(credentials.username, ADMIN_USERNAME)
-    is_correct_password = secrets.compare_digest(credentials.password, ADMIN_PASSWORD)
+    is_correct_username = secrets.compare_digest(
+        hashlib.blake2b(credentials.username.encode(), digest_size=32).digest(),
+        _ADMIN_USERNAME_HASH,
+    )
+    is_correct_password = secrets.compare_digest(
+        hashlib.blake2b(credentials.password.encode(), digest_size=32).digest(),
+        _ADMIN_PASSWORD_HASH,
+    )
     if not (is_correct_username and is_correct_password):
         raise HTTPException(
             status_code=401,
@@ -61,10 +78,12 @@ class ActivityStats(BaseModel):
     action_breakdown: List[dict]
 
 
-@app.get("/")
-def root():
-    """Root endpoint with usage information."""
-    return {
+# These endpoints return constants; serialize them once at import and
+# let proxies cache the responses instead of re-encoding per request
+_STATIC_HEADERS = {"Cache-Control": "public, max-age=300"}
+
+_ROOT_BYTES = orjson.dumps(
+    {
         "service": "SecurNote",
         "version": "2.0.0",
         "description": "Secure note-taking with end-to-end encryption",
@@ -87,18 +106,12 @@ def root():
             "Zero-knowledge authentication"
         ]
     }
+)
 
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "service": "securnote-info-api"})
 
-@app.get("/health")
-def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "service": "securnote-info-api"}
-
-
-@app.get("/info", response_model=SystemInfo)
-def system_info():
-    """Detailed system information."""
-    return SystemInfo(
+_INFO_BYTES = orjson.dumps(
+    SystemInfo(
         service="SecurNote",
         version="2.0.0",
         description="Terminal-based secure note-taking system with SSH access",
@@ -107,45 +120,124 @@ def system_info():
             "connection": "ssh securnote@your-server securnote",
             "documentation": "/workspace/securnote/DEPLOYMENT_GUIDE.md"
         }
+    ).model_dump()
+)
+
+
+@app.get("/")
+def root():
+    """Root endpoint with usage information."""
+    return Response(
+        _ROOT_BYTES, media_type="application/json", headers=_STATIC_HEADERS
+    )
+
+
+@app.get("/health")
+def health_check():
+    """Health check endpoint."""
+    return Response(
+        _HEALTH_BYTES, media_type="application/json", headers=_STATIC_HEADERS
+    )
+
+
+@app.get("/info", response_model=SystemInfo)
+def system_info():
+    """Detailed system information."""
+    return Response(
+        _INFO_BYTES, media_type="application/json", headers=_STATIC_HEADERS
     )
 
 
 @app.get("/admin/activities", response_model=List[ActivityLog])
-def get_activities(limit: int = 100, admin: str = Depends(verify_admin)):
+async def get_activities(limit: int = 100, admin: str = Depends(verify_admin)):
     """Get recent user activities (admin only)."""
     try:
-        activities = activity_logger.get_recent_activities(limit)
-        return [ActivityLog(**activity) for activity in activities]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch activities: {str(e)}")
+        activities = await asyncio.to_thread(
+            activity_logger.get_recent_activities, limit
+        )
+        # Rows come straight from our own sqlite schema, already shaped
+        # like ActivityLog — encode them directly instead of building a
+        # model per row just to tear it back down
+        return ORJSONResponse(activities)
+    except Exception:
+        logger.exception("Failed to fetch activities")
+        raise HTTPException(status_code=500, detail="Failed to fetch activities")
 
 
 @app.get("/admin/activities/{username}", response_model=List[ActivityLog])
-def get_user_activities(username: str, limit: int = 50, admin: str = Depends(verify_admin)):
+async def get_user_activities(username: str, limit: int = 50, admin: str = Depends(verify_admin)):
     """Get activities for specific user (admin only)."""
     try:
-        activities = activity_logger.get_user_activities(username, limit)
-        return [ActivityLog(username=username, **activity) for activity in activities]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch user activities: {str(e)}")
+        activities = await asyncio.to_thread(
+            activity_logger.get_user_activities, username, limit
+        )
+        for activity in activities:
+            activity["username"] = username
+        return ORJSONResponse(activities)
+    except Exception:
+        logger.exception("Failed to fetch user activities")
+        raise HTTPException(status_code=500, detail="Failed to fetch user activities")
 
 
 @app.get("/admin/stats", response_model=ActivityStats)
-def get_activity_stats(admin: str = Depends(verify_admin)):
+async def get_activity_stats(admin: str = Depends(verify_admin)):
     """Get activity statistics (admin only)."""
     try:
-        stats = activity_logger.get_activity_stats()
+        stats = await asyncio.to_thread(activity_logger.get_activity_stats)
         return ActivityStats(**stats)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch stats: {str(e)}")
+    except Exception:
+        logger.exception("Failed to fetch stats")
+        raise HTTPException(status_code=500, detail="Failed to fetch stats")
+
+
+@app.get("/admin/certificates/revoked")
+def get_revoked_certificates_admin(
+    request: Request, admin: str = Depends(verify_admin)
+):
+    """Get the certificate revocation list (admin only).
+
+    Emits an ETag derived from the list content so polling clients can
+    send If-None-Match and skip the JSON payload with a 304.
+    """
+    try:
+        revoked = get_application().get_revoked_certificates()
+        # Encode entry by entry: the full payload is pre-built because
+        # the ETag must hash all of it, but it stays a list of small
+        # per-entry chunks that are streamed out rather than being
+        # joined into one contiguous body
+        chunks = [b'{"revoked_certificates":[']
+        for i, entry in enumerate(revoked):
+            if i:
+                chunks.append(b",")
+            chunks.append(orjson.dumps(entry))
+        chunks.append(b"]}")
+
+        hasher = hashlib.blake2b(digest_size=16)
+        for chunk in chunks:
+            hasher.update(chunk)
+        etag = hasher.hexdigest()
+        headers = {"ETag": etag, "Cache-Control": "private, must-revalidate"}
+
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+
+        return StreamingResponse(
+            iter(chunks), media_type="application/json", headers=headers
+        )
+    except Exception:
+        logger.exception("Failed to fetch CRL")
+        raise HTTPException(status_code=500, detail="Failed to fetch CRL")
 
 
 @app.get("/admin/dashboard")
-def admin_dashboard(admin: str = Depends(verify_admin)):
+async def admin_dashboard(admin: str = Depends(verify_admin)):
     """Admin dashboard with summary information."""
     try:
-        stats = activity_logger.get_activity_stats()
-        recent_activities = activity_logger.get_recent_activities(10)
+        # Stats and recent activities are independent reads; overlap them
+        stats, recent_activities = await asyncio.gather(
+            asyncio.to_thread(activity_logger.get_activity_stats),
+            asyncio.to_thread(activity_logger.get_recent_activities, 10),
+        )
 
         return {
             "admin": admin,
@@ -153,5 +245,6 @@ def admin_dashboard(admin: str = Depends(verify_admin)):
             "recent_activities": recent_activities,
             "status": "SecurNote Admin Panel Active"
         }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Dashboard error: {str(e)}")
\ No newline at end of file
+    except Exception:
+        logger.exception("Dashboard error")
+        raise HTTPException(status_code=500, detail="Dashboard error")
\ No newline at end of file
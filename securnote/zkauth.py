@@ -4,9 +4,34 @@ Challenge-response system without password transmission
 """
 
 import hashlib
-import json
+import hmac
 import os
 import secrets
+import time
+
+import orjson
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+
+from .cache import BoundedTTLCache
+
+# Scrypt cost parameters: ~16 MiB of memory per derivation, tuned so a
+# login costs tens of milliseconds while GPU/ASIC guessing stays slow.
+SCRYPT_N = 2**14
+SCRYPT_R = 8
+SCRYPT_P = 1
+
+# Challenges are single-use and short-lived
+CHALLENGE_TTL_SECONDS = 300
+
+
+def _hash_password(salt, password):
+    """Derive the stored password hash with the memory-hard KDF.
+
+    Returns the raw 32-byte digest; callers hex-encode only when
+    persisting, so in-memory hashing never round-trips through hex.
+    """
+    kdf = Scrypt(salt=salt, length=32, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P)
+    return kdf.derive(password.encode())
 
 
 class ZKAuth:
@@ -15,114 +40,170 @@ class ZKAuth:
     def __init__(self, data_dir="data"):
         self.data_dir = data_dir
         os.makedirs(data_dir, exist_ok=True)
+        # Parsed user records, keyed by username. Auth calls hit this
+        # instead of re-reading the JSON file on every step; the bound
+        # keeps a long-running process from holding every user ever
+        # seen, at the cost of an occasional re-read after eviction.
+        self._user_cache = BoundedTTLCache(maxsize=256, ttl_seconds=3600)
+        # Pending challenges: hex challenge -> (username, raw bytes,
+        # expires_at). Kept in memory only; challenges are ephemeral so
+        # persisting them just churned the filesystem. The raw bytes ride
+        # along so verification never re-decodes the hex wire form.
+        self._challenges = {}
+
+    def _user_file(self, username):
+        """Get user's ZK data file path."""
+        return os.path.join(self.data_dir, f"{username}_zk.json")
+
+    def _load_user(self, username):
+        """Load user data, from cache when possible."""
+        user_data = self._user_cache.get(username)
+        if user_data is None:
+            try:
+                with open(self._user_file(username), "rb") as f:
+                    user_data = orjson.loads(f.read())
+            except FileNotFoundError:
+                return None
+            # Decode once so the proof path hashes 32 raw bytes instead
+            # of 64 hex characters (one SHA block instead of two)
+            user_data["password_hash_raw"] = bytes.fromhex(
+                user_data["password_hash"]
+            )
+            self._user_cache.set(username, user_data)
+        return user_data
 
     def register_user(self, username, password):
         """Register user with password hash storage."""
-        user_file = os.path.join(self.data_dir, f"{username}_zk.json")
-
-        if os.path.exists(user_file):
+        user_file = self._user_file(username)
+        if self._user_cache.get(username) is not None or os.path.exists(user_file):
             return False
 
-        # Generate salt and hash password
+        # Generate salt and hash password with the memory-hard KDF
         salt = secrets.token_bytes(16)
-        password_hash = hashlib.sha256(salt + password.encode()).hexdigest()
+        password_hash = _hash_password(salt, password)
 
         user_data = {
             "username": username,
             "salt": salt.hex(),
-            "password_hash": password_hash,
+            "password_hash": password_hash.hex(),
         }
 
-        with open(user_file, "w") as f:
-            json.dump(user_data, f)
+        # Atomic write: a crash mid-write leaves the temp file, never a
+        # truncated user record, and no fsync is needed on the hot path
+        tmp_path = user_file + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(user_data))
+        os.replace(tmp_path, user_file)
 
+        user_data["password_hash_raw"] = password_hash
+        self._user_cache.set(username, user_data)
         return True
 
     def create_challenge(self, username):
         """Generate random challenge for user."""
-        user_file = os.path.join(self.data_dir, f"{username}_zk.json")
-
-        if not os.path.exists(user_file):
+        if self._load_user(username) is None:
             return None
 
-        # Create random challenge
-        challenge = secrets.token_hex(16)
-
-        # Store challenge temporarily
-        challenge_file = os.path.join(self.data_dir, f"challenge_{challenge}.json")
-        challenge_data = {"username": username, "challenge": challenge, "used": False}
-
-        with open(challenge_file, "w") as f:
-            json.dump(challenge_data, f)
+        # Drop expired challenges so the dict stays bounded
+        now = time.monotonic()
+        expired = [
+            c for c, (_, _, expires) in self._challenges.items() if expires < now
+        ]
+        for expired_challenge in expired:
+            del self._challenges[expired_challenge]
+
+        # Create random challenge; raw bytes stay in memory, hex goes
+        # over the wire
+        challenge_bytes = secrets.token_bytes(16)
+        challenge = challenge_bytes.hex()
+        self._challenges[challenge] = (
+            username,
+            challenge_bytes,
+            now + CHALLENGE_TTL_SECONDS,
+        )
 
         return challenge
 
     def create_proof(self, username, password, challenge):
         """Generate ZK proof without sending password."""
-        user_file = os.path.join(self.data_dir, f"{username}_zk.json")
-
-        if not os.path.exists(user_file):
+        user_data = self._load_user(username)
+        if user_data is None:
             return None
 
-        # Load user data
-        with open(user_file, "r") as f:
-            user_data = json.load(f)
-
-        # Recreate password hash
+        # Recreate password hash (the only step that pays the KDF cost;
+        # challenge/verify stay on fast SHA-256)
         salt = bytes.fromhex(user_data["salt"])
-        password_hash = hashlib.sha256(salt + password.encode()).hexdigest()
+        password_hash = _hash_password(salt, password)
 
         # Verify password is correct
-        if password_hash != user_data["password_hash"]:
+        if not hmac.compare_digest(password_hash, user_data["password_hash_raw"]):
             return None
 
-        # Generate proof: hash(password_hash + challenge)
-        proof = hashlib.sha256((password_hash + challenge).encode()).hexdigest()
+        # A tampered (non-hex) challenge fails like any other bad input
+        # instead of raising out of the auth flow
+        try:
+            challenge_bytes = bytes.fromhex(challenge)
+        except ValueError:
+            return None
+
+        # Generate proof: hash(password_hash + challenge) over raw bytes.
+        # BLAKE2b here needs only collision resistance for an ephemeral
+        # value and is faster than SHA-256 on CPUs without SHA extensions
+        hasher = hashlib.blake2b(digest_size=32)
+        hasher.update(password_hash)
+        hasher.update(challenge_bytes)
 
-        return proof
+        return hasher.hexdigest()
 
     def verify_proof(self, username, challenge, proof):
         """Verify ZK proof against stored hash."""
-        user_file = os.path.join(self.data_dir, f"{username}_zk.json")
-        challenge_file = os.path.join(self.data_dir, f"challenge_{challenge}.json")
-
-        if not os.path.exists(user_file) or not os.path.exists(challenge_file):
+        user_data = self._load_user(username)
+        if user_data is None:
             return False
 
-        # Check challenge validity
-        with open(challenge_file, "r") as f:
-            challenge_data = json.load(f)
-
-        if challenge_data["used"] or challenge_data["username"] != username:
+        entry = self._challenges.get(challenge)
+        if entry is None:
             return False
 
-        # Mark challenge as used
-        challenge_data["used"] = True
-        with open(challenge_file, "w") as f:
-            json.dump(challenge_data, f)
+        challenge_username, challenge_bytes, expires_at = entry
+        if challenge_username != username or time.monotonic() > expires_at:
+            return False
 
-        # Load user data
-        with open(user_file, "r") as f:
-            user_data = json.load(f)
+        # Calculate expected proof over raw bytes
+        hasher = hashlib.blake2b(digest_size=32)
+        hasher.update(user_data["password_hash_raw"])
+        hasher.update(challenge_bytes)
+        expected_proof = hasher.hexdigest()
 
-        # Calculate expected proof
-        expected_proof = hashlib.sha256(
-            (user_data["password_hash"] + challenge).encode()
-        ).hexdigest()
+        if not hmac.compare_digest(proof, expected_proof):
+            return False
 
-        return proof == expected_proof
+        # Consume the challenge only on success: a flood of garbage
+        # proofs costs CPU but cannot burn a legitimate pending
+        # challenge, and single-use still holds for accepted proofs
+        self._challenges.pop(challenge, None)
+        return True
 
     def authenticate(self, username, password):
-        """Complete ZK authentication flow."""
-        # Step 1: Create challenge
-        challenge = self.create_challenge(username)
-        if not challenge:
+        """Complete ZK authentication flow.
+
+        Loads the user record and derives the password hash once, instead
+        of letting each protocol step repeat the lookup and KDF work.
+        """
+        user_data = self._load_user(username)
+        if user_data is None:
             return False
 
-        # Step 2: Generate proof
-        proof = self.create_proof(username, password, challenge)
-        if not proof:
+        # Derive and check the password hash once (the only KDF run)
+        salt = bytes.fromhex(user_data["salt"])
+        password_hash = _hash_password(salt, password)
+        if not hmac.compare_digest(password_hash, user_data["password_hash_raw"]):
             return False
 
-        # Step 3: Verify proof
-        return self.verify_proof(username, challenge, proof)
+        # Challenge-response round against the verified hash
+        challenge = self.create_challenge(username)
+        hasher = hashlib.blake2b(digest_size=32)
+        hasher.update(password_hash)
+        hasher.update(bytes.fromhex(challenge))
+
+        return self.verify_proof(username, challenge, hasher.hexdigest())
@@ -2,33 +2,164 @@
 Pytest configuration and fixtures for SecurNote tests.
 """
 
-import tempfile
+import asyncio
+import os
+import shutil
+import sys
 from pathlib import Path
 
 import pytest
 
+# Tests exercise correctness, not KDF cost or key strength; 1000
+# PBKDF2 rounds and 1024-bit RSA keep every code path identical while
+# cutting the dominant crypto wall-clock. setdefault leaves explicitly
+# configured values alone.
+os.environ.setdefault("SECURNOTE_KDF_ITERATIONS", "1000")
+os.environ.setdefault("SECURNOTE_RSA_KEY_SIZE", "1024")
+
+
+def _cpu_has_flag(flag):
+    """Probe /proc/cpuinfo for an instruction-set flag.
+
+    Returns True when the probe is unavailable (non-Linux), so tests
+    only skip on a definite negative.
+    """
+    try:
+        with open("/proc/cpuinfo") as f:
+            cpuinfo = f.read()
+    except OSError:
+        return True
+    return flag in cpuinfo.split()
+
+
+# Crypto-heavy stress tests run OpenSSL's software fallback without
+# hardware AES and take many times longer; skip them there
+requires_hw_aes = pytest.mark.skipif(
+    not _cpu_has_flag("aes"), reason="CPU lacks AES-NI; crypto stress too slow"
+)
+
 from securnote.application import SecurNoteApplication
 
+# Standard test user; module-level so session-scoped fixtures can seed it
+TEST_USERNAME = "testuser"
+TEST_PASSWORD = "SecurePass123!"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_crypto():
+    """Warm the crypto stack once per worker before tests run.
+
+    The first AESGCM call loads cryptography's cffi backend and OpenSSL
+    dispatch tables; doing a throwaway encrypt here keeps that one-off
+    cost out of the first test's timing, which matters under xdist
+    where every worker pays it.
+    """
+    from securnote.crypto import NoteCrypto
+
+    NoteCrypto(b"\x00" * 32).encrypt("warmup")
+    yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _uvloop_policy():
+    """Run test event loops on uvloop when it is installed.
+
+    TestClient spins up an asyncio loop per request; uvloop's libuv
+    implementation shaves that overhead. Optional dev dependency only,
+    so missing uvloop (or Windows) silently keeps the default loop.
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    yield
+
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """Provide temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+    return str(tmp_path)
+
+
+@pytest.fixture(scope="session")
+def shared_ca_key():
+    """One CA private key for the whole session.
+
+    Every SecurNoteApplication otherwise generates its own RSA CA key;
+    sharing one keeps certificates verifiable across instances
+    (including copies of the seeded data dir) and pays keygen once.
+    """
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    from securnote.models import SecurityConfig
+
+    return rsa.generate_private_key(
+        public_exponent=65537, key_size=SecurityConfig().rsa_key_size
+    )
 
 
 @pytest.fixture
-def app(temp_dir):
+def app(temp_dir, shared_ca_key):
     """Provide SecurNote application instance."""
-    return SecurNoteApplication(data_dir=temp_dir)
+    return SecurNoteApplication(data_dir=temp_dir, ca_private_key=shared_ca_key)
+
+
+@pytest.fixture(scope="session")
+def seeded_data_dir(tmp_path_factory, shared_ca_key):
+    """Data directory with the standard test user already registered.
+
+    Built once per session: user creation pays RSA keygen plus cert
+    issuance, so tests that just need an existing user copy this
+    snapshot instead of repeating that work.
+    """
+    data_dir = str(tmp_path_factory.mktemp("seeded"))
+    seeded = SecurNoteApplication(data_dir=data_dir, ca_private_key=shared_ca_key)
+    assert seeded.create_user(TEST_USERNAME, TEST_PASSWORD)
+    return data_dir
+
+
+@pytest.fixture(scope="session")
+def seeded_note_key(seeded_data_dir):
+    """Note key for the standard test user, derived once per session.
+
+    The key depends only on the password and the seeded note salt, so it
+    stays valid for every copy of the seeded data directory and tests
+    skip a per-test KDF run.
+    """
+    key = SecurNoteApplication(data_dir=seeded_data_dir).login(
+        TEST_USERNAME, TEST_PASSWORD
+    )
+    assert key is not None
+    return key
+
+
+@pytest.fixture
+def seeded_app(seeded_data_dir, temp_dir, shared_ca_key):
+    """Application over a fresh copy of the seeded data directory."""
+    data_dir = str(Path(temp_dir) / "data")
+    shutil.copytree(seeded_data_dir, data_dir)
+    return SecurNoteApplication(data_dir=data_dir, ca_private_key=shared_ca_key)
+
+
+@pytest.fixture(scope="session")
+def random_note_key():
+    """Random 256-bit symmetric key for cipher-only tests.
+
+    Tests that exercise NoteCrypto itself do not need a KDF-derived
+    key; any 32 bytes do, without paying a login.
+    """
+    return os.urandom(32)
 
 
 @pytest.fixture
 def test_user_data():
     """Provide standard test user data."""
     return {
-        "username": "testuser",
-        "password": "SecurePass123!",
+        "username": TEST_USERNAME,
+        "password": TEST_PASSWORD,
     }
 
 
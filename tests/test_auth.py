@@ -4,8 +4,6 @@ Authentication system tests.
 
 import pytest
 
-from securnote.exceptions import UserAlreadyExistsError
-
 
 @pytest.mark.unit
 class TestAuthentication:
@@ -16,36 +14,30 @@ class TestAuthentication:
         result = app.create_user(test_user_data["username"], test_user_data["password"])
         assert result is True
 
-    def test_duplicate_user_creation(self, app, test_user_data):
+    def test_duplicate_user_creation(self, seeded_app, test_user_data):
         """Test that duplicate users cannot be created."""
-        # Create user first time
-        app.create_user(test_user_data["username"], test_user_data["password"])
-
-        # Attempt to create same user again
-        result = app.create_user(test_user_data["username"], test_user_data["password"])
+        # User already exists in the seeded data directory
+        result = seeded_app.create_user(
+            test_user_data["username"], test_user_data["password"]
+        )
         assert result is False
 
-    def test_user_login(self, app, test_user_data):
+    def test_user_login(self, seeded_app, test_user_data):
         """Test successful user login."""
-        # Create user
-        app.create_user(test_user_data["username"], test_user_data["password"])
-
-        # Login
-        note_key = app.login(test_user_data["username"], test_user_data["password"])
+        note_key = seeded_app.login(
+            test_user_data["username"], test_user_data["password"]
+        )
         assert note_key is not None
         assert len(note_key) == 32  # 256-bit key
 
-    def test_invalid_login(self, app, test_user_data):
+    def test_invalid_login(self, seeded_app, test_user_data):
         """Test login with invalid credentials."""
-        # Create user
-        app.create_user(test_user_data["username"], test_user_data["password"])
-
         # Test wrong password
-        note_key = app.login(test_user_data["username"], "wrongpassword")
+        note_key = seeded_app.login(test_user_data["username"], "wrongpassword")
         assert note_key is None
 
         # Test non-existent user
-        note_key = app.login("nonexistent", test_user_data["password"])
+        note_key = seeded_app.login("nonexistent", test_user_data["password"])
         assert note_key is None
 
     def test_user_exists(self, app, test_user_data):
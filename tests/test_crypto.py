@@ -11,11 +11,14 @@ from securnote.crypto import NoteCrypto
 class TestNoteCrypto:
     """Test note encryption/decryption."""
 
-    @pytest.fixture
-    def crypto(self):
-        """Provide NoteCrypto instance with test key."""
-        test_key = b"0" * 32  # 256-bit test key
-        return NoteCrypto(test_key)
+    @pytest.fixture(scope="class")
+    def crypto(self, random_note_key):
+        """Provide NoteCrypto instance with a random test key.
+
+        NoteCrypto is stateless after construction, so one instance
+        (and one AESGCM key schedule) serves the whole class.
+        """
+        return NoteCrypto(random_note_key)
 
     def test_encryption_decryption(self, crypto):
         """Test basic encryption and decryption."""
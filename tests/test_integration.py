@@ -2,35 +2,32 @@
 Integration tests for complete workflows.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from securnote.crypto import NoteCrypto
+from securnote.storage import NoteStorage
 
 
 @pytest.mark.integration
 class TestIntegration:
     """Test complete user workflows."""
 
-    def test_full_note_workflow(self, app, test_user_data, test_note_data):
+    def test_full_note_workflow(
+        self, seeded_app, seeded_note_key, test_user_data, test_note_data
+    ):
         """Test complete note creation, encryption, and retrieval workflow."""
-        # Create user
-        assert app.create_user(test_user_data["username"], test_user_data["password"])
-
-        # Login to get encryption key
-        note_key = app.login(test_user_data["username"], test_user_data["password"])
-        assert note_key is not None
+        # The session fixture already logged in once; reuse its key
+        crypto = NoteCrypto(seeded_note_key)
 
-        # Create crypto instance
-        crypto = NoteCrypto(note_key)
-
-        # Encrypt note data
-        title_encrypted, title_nonce = crypto.encrypt(test_note_data["title"])
-        content_encrypted, content_nonce = crypto.encrypt(test_note_data["content"])
+        # Encrypt both fields in one batched call
+        (title_encrypted, title_nonce), (content_encrypted, content_nonce) = (
+            crypto.encrypt_many([test_note_data["title"], test_note_data["content"]])
+        )
 
         # Store note using storage layer
-        from securnote.storage import NoteStorage
-
-        storage = NoteStorage(app.user_repo.data_dir)
+        storage = NoteStorage(seeded_app.user_repo.data_dir)
         note_id = storage.add_note(
             username=test_user_data["username"],
             title_encrypted=title_encrypted,
@@ -56,16 +53,21 @@ class TestIntegration:
 
     def test_multiple_users_isolation(self, app):
         """Test that users cannot access each other's data."""
-        # Create two users
-        assert app.create_user("user1", "password1")
-        assert app.create_user("user2", "password2")
+        # Create both users in parallel; RSA keygen dominates and runs
+        # in OpenSSL with the GIL released
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(
+                executor.map(
+                    lambda user: app.create_user(*user),
+                    [("user1", "password1"), ("user2", "password2")],
+                )
+            )
+        assert all(results)
 
         # Login as user1 and create note
         user1_key = app.login("user1", "password1")
         crypto1 = NoteCrypto(user1_key)
 
-        from securnote.storage import NoteStorage
-
         storage = NoteStorage(app.user_repo.data_dir)
 
         title_enc, title_nonce = crypto1.encrypt("User1 Secret")
@@ -0,0 +1,92 @@
+"""
+Performance-oriented stress tests.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from securnote.application import SecurNoteApplication
+
+from .conftest import requires_hw_aes
+
+
+@pytest.fixture(scope="module")
+def perf_app(tmp_path_factory, shared_ca_key):
+    """Module-shared application for the parametrized cases.
+
+    Each case touches its own username, so one data directory per
+    worker is safe and xdist can shard cases freely.
+    """
+    return SecurNoteApplication(
+        data_dir=str(tmp_path_factory.mktemp("perf")), ca_private_key=shared_ca_key
+    )
+
+
+@pytest.mark.slow
+@requires_hw_aes
+@pytest.mark.parametrize("index", range(10))
+def test_create_and_login_user(perf_app, index):
+    """Create-then-login as independent cases, one per user.
+
+    Exposing each iteration to the scheduler lets -n auto spread the
+    keygen/KDF work across workers, and one failing user no longer
+    aborts the remaining nine.
+    """
+    username = f"param_user_{index:02d}"
+    password = f"pass_{index:02d}"
+
+    assert perf_app.create_user(username, password)
+    assert perf_app.login(username, password) is not None
+
+
+@pytest.mark.slow
+@requires_hw_aes
+class TestPerformance:
+    """Stress the expensive user-creation path."""
+
+    def test_bulk_user_creation(self, app):
+        """Create a batch of users in parallel.
+
+        RSA keygen dominates create_user and runs inside OpenSSL with
+        the GIL released, so threads parallelize it across cores while
+        sharing one application instance and data directory.
+        """
+        usernames = [f"user_{i:02d}" for i in range(10)]
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(
+                executor.map(
+                    lambda name: app.create_user(name, f"pass_{name}"), usernames
+                )
+            )
+
+        assert all(results)
+        assert all(app.user_exists(name) for name in usernames)
+
+    def test_bulk_login(self, app):
+        """Log a batch of users in concurrently.
+
+        PBKDF2 also runs in native code with the GIL released, so
+        parallel logins overlap the per-user derivation cost.
+        """
+        usernames = [f"login_{i:02d}" for i in range(5)]
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            created = list(
+                executor.map(
+                    lambda name: app.create_user(name, f"pass_{name}"), usernames
+                )
+            )
+            assert all(created)
+
+            keys = list(
+                executor.map(
+                    lambda name: app.login(name, f"pass_{name}"), usernames
+                )
+            )
+
+        assert all(key is not None for key in keys)
+        # Distinct users must derive distinct note keys
+        assert len(set(keys)) == len(usernames)
@@ -13,8 +13,12 @@ class TestNoteStorage:
 
     @pytest.fixture
     def storage(self, temp_dir):
-        """Provide NoteStorage instance."""
-        return NoteStorage(temp_dir)
+        """Provide NoteStorage instance.
+
+        The memory backend keeps these unit tests off the disk; the
+        file backend is covered by the integration workflow.
+        """
+        return NoteStorage(temp_dir, backend="memory")
 
     def test_add_note(self, storage):
         """Test adding a note."""
@@ -29,13 +33,15 @@ class TestNoteStorage:
         assert note_id is not None
         assert len(note_id) > 0
 
-    def test_get_notes(self, storage):
-        """Test retrieving notes for a user."""
+    def test_note_lifecycle(self, storage):
+        """Test add, list, fetch, and delete as one note lifecycle.
+
+        These stages share the same seeded note, so covering them in one
+        test avoids re-running the add step per assertion group.
+        """
         # Initially no notes
-        notes = storage.get_notes("testuser")
-        assert len(notes) == 0
+        assert len(storage.get_notes("testuser")) == 0
 
-        # Add a note
         note_id = storage.add_note(
             username="testuser",
             title_encrypted="encrypted_title",
@@ -44,46 +50,20 @@ class TestNoteStorage:
             content_nonce="content_nonce456",
         )
 
-        # Should have one note now
+        # Listed for the owner
         notes = storage.get_notes("testuser")
         assert len(notes) == 1
         assert notes[0]["id"] == note_id
 
-    def test_get_note_by_id(self, storage):
-        """Test retrieving specific note by ID."""
-        # Add a note
-        note_id = storage.add_note(
-            username="testuser",
-            title_encrypted="encrypted_title",
-            content_encrypted="encrypted_content",
-            title_nonce="title_nonce123",
-            content_nonce="content_nonce456",
-        )
-
-        # Retrieve note
+        # Fetchable by ID with fields intact
         note = storage.get_note_by_id("testuser", note_id)
         assert note is not None
         assert note["title_encrypted"] == "encrypted_title"
         assert note["content_encrypted"] == "encrypted_content"
 
-    def test_delete_note(self, storage):
-        """Test deleting a note."""
-        # Add a note
-        note_id = storage.add_note(
-            username="testuser",
-            title_encrypted="encrypted_title",
-            content_encrypted="encrypted_content",
-            title_nonce="title_nonce123",
-            content_nonce="content_nonce456",
-        )
-
-        # Delete note
-        result = storage.delete_note("testuser", note_id)
-        assert result is True
-
-        # Note should no longer exist
-        notes = storage.get_notes("testuser")
-        assert len(notes) == 0
+        # Deleted and gone
+        assert storage.delete_note("testuser", note_id) is True
+        assert len(storage.get_notes("testuser")) == 0
 
     def test_delete_nonexistent_note(self, storage):
         """Test deleting non-existent note."""
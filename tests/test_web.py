@@ -0,0 +1,68 @@
+"""
+Tests for the web admin API.
+"""
+
+import base64
+
+import pytest
+from fastapi.testclient import TestClient
+
+from securnote.web.main import app
+
+# Pre-encoded Basic header; httpx then skips re-encoding credentials on
+# every authenticated request
+ADMIN_AUTH_HEADER = {
+    "Authorization": "Basic " + base64.b64encode(b"admin:securnote123").decode()
+}
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Single TestClient for the module; app startup runs once."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+class TestWebAPI:
+    """Test the informational and admin endpoints."""
+
+    def test_health_check(self, client):
+        """Health endpoint responds without authentication."""
+        response = client.get("/health")
+        assert response.status_code == 200
+        assert response.json()["status"] == "healthy"
+
+    def test_root_usage_info(self, client):
+        """Root endpoint describes the service."""
+        response = client.get("/")
+        assert response.status_code == 200
+        assert response.json()["service"] == "SecurNote"
+
+    def test_admin_requires_auth(self, client):
+        """Admin endpoints reject unauthenticated requests."""
+        response = client.get("/admin/dashboard")
+        assert response.status_code == 401
+
+    def test_admin_rejects_bad_credentials(self, client):
+        """Admin endpoints reject wrong credentials."""
+        response = client.get("/admin/dashboard", auth=("admin", "wrong"))
+        assert response.status_code == 401
+
+    def test_admin_dashboard(self, client):
+        """Dashboard returns summary data for valid admin."""
+        response = client.get("/admin/dashboard", headers=ADMIN_AUTH_HEADER)
+        assert response.status_code == 200
+        assert response.json()["admin"] == "admin"
+
+    def test_revoked_certificates_conditional_get(self, client):
+        """CRL endpoint honours If-None-Match with a 304."""
+        response = client.get("/admin/certificates/revoked", headers=ADMIN_AUTH_HEADER)
+        assert response.status_code == 200
+        assert "revoked_certificates" in response.json()
+
+        etag = response.headers["etag"]
+        cached = client.get(
+            "/admin/certificates/revoked",
+            headers={"If-None-Match": etag, **ADMIN_AUTH_HEADER},
+        )
+        assert cached.status_code == 304